@@ -22,9 +22,29 @@ import logging
 import asyncio
 import aiohttp
 import re
-import xml.etree.ElementTree as ET
+import sys
+from dataclasses import dataclass
 from html import unescape
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List, Optional, Set
+from lxml import etree
+
+try:
+    # C-level HTML parser (lexbor); falls back to regex stripping when unavailable
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    # SIMD-accelerated JSON decoding; falls back to the standard library
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:
+    # Aho-Corasick automaton for concept extraction; falls back to a compiled regex
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Import configuration for full functionality preservation
 from config import CONFIG
@@ -32,6 +52,113 @@ from config import CONFIG
 logger = logging.getLogger("ai-chatbot")
 logger.setLevel(logging.INFO)
 
+# Maximum number of cached responses to repeated user messages
+RESPONSE_CACHE_SIZE = 512
+
+# Query vocabularies for response categories. A query word matches when it
+# starts with one of the stems, so inflections ("recently", "newest",
+# "modeling", "technologies") count as well
+COE_QUERY_STEMS = ('coe', 'excellen', 'trilogy')
+TECH_QUERY_STEMS = ('technolog', 'tool', 'interesting', 'covered', 'model', 'platform')
+RECENT_QUERY_STEMS = ('latest', 'recent', 'new')
+# Query stems per keyword-driven response category
+CATEGORY_STEMS = {
+    'coe': COE_QUERY_STEMS,
+    'tech': TECH_QUERY_STEMS,
+    'recent': RECENT_QUERY_STEMS
+}
+# Handler order used to break ties between equally scored categories
+CATEGORY_PRIORITY = ('coe', 'tech', 'author', 'recent')
+# Title words identifying Trilogy's own CoE article
+COE_TITLE_TERMS = frozenset({'impact', 'adoption', 'defining'})
+
+# Author first names recognised in queries
+AUTHOR_MAPPING = {
+    'stanislav': 'Stanislav Huseletov',
+    'leonardo': 'Leonardo Gonzalez',
+    'david': 'David Proctor',
+    'praveen': 'Praveen Koka'
+}
+
+# Characters of article content quoted in CoE replies
+COE_EXCERPT_LENGTH = 800
+# Longest content prefix read anywhere after ingestion; the rest is dropped
+STORED_CONTENT_LENGTH = max(
+    CONFIG.CONTEXT_LENGTH, CONFIG.CONTENT_PREVIEW_LENGTH, COE_EXCERPT_LENGTH)
+
+# Pre-compiled patterns for HTML cleaning (run twice per article on every fetch)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+_sub_tag = _HTML_TAG_RE.sub
+_sub_ws = _WS_RE.sub
+
+# Word tokenizer for query and title keyword matching
+_TOKEN_RE = re.compile(r'\w+')
+
+# Pre-compiled XPath queries for RSS fallback parsing
+_RSS_NAMESPACES = {
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'content': 'http://purl.org/rss/1.0/modules/content/'
+}
+_item_xp = etree.XPath('.//item')
+_title_xp = etree.XPath('title')
+_author_xp = etree.XPath('author')
+_creator_xp = etree.XPath('.//dc:creator', namespaces=_RSS_NAMESPACES)
+_pub_date_xp = etree.XPath('pubDate')
+_link_xp = etree.XPath('link')
+_description_xp = etree.XPath('description')
+_content_xp = etree.XPath('.//content:encoded', namespaces=_RSS_NAMESPACES)
+
+
+def _first_text(elements: list, default: str) -> str:
+    """Return the text of the first matched element, or default if none matched"""
+    return elements[0].text if elements else default
+
+
+def _build_concept_scanner(*pattern_lists: List[str]) -> Callable[[str], Set[str]]:
+    """Build a single-pass scanner returning every concept pattern found in a text"""
+    patterns = sorted(
+        {pattern for patterns in pattern_lists for pattern in patterns if pattern},
+        key=len, reverse=True)
+    if not patterns:
+        return lambda text: set()
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda text: {pattern for _, pattern in automaton.iter(text)}
+
+    # Fallback: one compiled alternation tried at every position via a lookahead,
+    # so overlapping patterns (e.g. 'firecrawl' and 'crawl') are all reported.
+    # Only the longest pattern starting at a position is captured, so each hit
+    # also accounts for the shorter patterns it contains.
+    concept_re = re.compile('(?=(' + '|'.join(map(re.escape, patterns)) + '))')
+    contained = {
+        pattern: {other for other in patterns if other in pattern} for pattern in patterns}
+
+    def scan(text: str) -> Set[str]:
+        found = set()
+        for match in concept_re.finditer(text):
+            found |= contained[match.group(1)]
+        return found
+
+    return scan
+
+
+@dataclass(slots=True)
+class Article:
+    """A cleaned knowledge base article"""
+    title: str
+    author: str
+    published: str
+    link: str
+    summary: str
+    full_content: str
+    concepts: Dict[str, List[str]]
+
+
 # ==============================================================================
 # TRILOGY AI CHATBOT IMPLEMENTATION
 # ==============================================================================
@@ -46,22 +173,51 @@ class TrilogyAIChatbot:
     """
 
     def __init__(self):
-        self.knowledge_base: List[Dict[str, Any]] = []
+        self.knowledge_base: List[Article] = []
         self.knowledge_map: Dict[str, Any] = {}
         self.is_initialized = False
         self.realtime_instructions = ""
+        # Article title -> 1-based article number
+        self._title_to_num: Dict[str, int] = {}
+        # Per-article columns in article order, for scans that need a single field
+        self._titles: List[str] = []
+        # Lowercased word tokens of each article title, in article order
+        self._title_tokens: List[set] = []
         # Pre-compiled patterns for performance (from original system)
         self.tool_patterns = CONFIG.TOOL_PATTERNS
         self.model_patterns = CONFIG.MODEL_PATTERNS
         self.method_patterns = CONFIG.METHODOLOGY_PATTERNS
+        self._concept_scanner = _build_concept_scanner(
+            self.tool_patterns, self.model_patterns, self.method_patterns)
+        # Response category -> handler (see _rank_categories)
+        self._category_handlers = {
+            'coe': self._respond_coe,
+            'tech': self._respond_tech,
+            'author': self._respond_author,
+            'recent': self._respond_recent
+        }
+        # Normalized user message -> generated response (valid until re-initialization)
+        self._response_cache: Dict[str, str] = {}
+        # Shared HTTP session for feed fetching (created lazily on first use)
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Constant response fragments, rebuilt whenever the knowledge base changes
+        self._tpl = self._build_response_templates()
 
     async def initialize(self) -> str:
         """Initialize with full knowledge processing from original system"""
         logger.info(f"Loading {CONFIG.EXPERT_DOMAIN} knowledge base...")
+        self._response_cache.clear()
 
         try:
             # Fetch comprehensive knowledge content (same as original)
             self.knowledge_base = await self._fetch_comprehensive_content()
+            self._title_to_num = {}
+            for i, article in enumerate(self.knowledge_base, 1):
+                self._title_to_num.setdefault(article.title, i)
+            self._titles = [article.title for article in self.knowledge_base]
+            self._title_tokens = [
+                set(_TOKEN_RE.findall(title.lower())) for title in self._titles]
+            self._tpl = self._build_response_templates()
 
             if self.knowledge_base:
                 logger.info(
@@ -81,7 +237,7 @@ class TrilogyAIChatbot:
                 self.is_initialized = True
 
                 # Use CONFIG loading message (preserves original functionality)
-                latest_title = self.knowledge_map['latest_article']['title'][:40]
+                latest_title = self.knowledge_map['latest_article'].title[:40]
                 ready_message = CONFIG.LOADING_MESSAGES['ready'].format(
                     article_count=len(self.knowledge_base),
                     latest_title=latest_title
@@ -105,8 +261,26 @@ class TrilogyAIChatbot:
         if not self.is_initialized:
             return "I'm still loading my knowledge base. Please wait a moment."
 
+        # Responses only depend on the normalized message once the knowledge base is loaded
+        cache_key = user_message.strip().lower()
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Use the sophisticated response generation with all article content
-        return self._generate_sophisticated_response(user_message)
+        response = self._generate_sophisticated_response(user_message)
+
+        # Evict the oldest entry once the cache is full
+        if len(self._response_cache) >= RESPONSE_CACHE_SIZE:
+            del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[cache_key] = response
+        return response
+
+    async def close(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
 
     def get_full_instructions(self) -> str:
         """Return the full optimized instructions for use by the avatar service"""
@@ -159,155 +333,196 @@ class TrilogyAIChatbot:
         if len(content_words) < 3:
             return ""
 
-        # AI Center of Excellence / CoE queries - TRILOGY-SPECIFIC content first
-        if any(term in user_lower for term in ['center of excellence', 'coe', 'ai center', 'excellence', 'trilogy']):
+        # Tokenize the query once for all category checks
+        query_tokens = set(_TOKEN_RE.findall(user_lower))
 
-            # PRIORITY 1: Look for Trilogy-specific CoE content
-            trilogy_coe_article = None
-            for i, article in enumerate(self.knowledge_base, 1):
-                if 'trilogy' in article['title'].lower() and any(term in article['title'].lower() for term in ['impact', 'adoption', 'defining']):
-                    trilogy_coe_article = {
-                        'number': i,
-                        'title': article['title'],
-                        'author': article['author'],
-                        'summary': article['summary'],
-                        'content': article['full_content'][:800]
-                    }
-                    break
-
-            if trilogy_coe_article:
-                return f"Here's Trilogy's specific Center of Excellence approach from our research:\n\n" + \
-                    f"Article #{trilogy_coe_article['number']}: '{trilogy_coe_article['title']}' by {trilogy_coe_article['author']}\n\n" + \
-                    f"Summary: {trilogy_coe_article['summary']}\n\n" + \
-                    f"Key details from the research:\n{trilogy_coe_article['content']}...\n\n" + \
-                    f"This article provides specific insights into how Trilogy's AI Center of Excellence differs from other companies through data-driven approaches and measurable impact metrics."
-
-            # PRIORITY 2: Search for other CoE-related content in our research
-            relevant_findings = []
-            for title, findings in self.knowledge_map.get('key_findings', {}).items():
-                content_check = (
-                    title + ' ' + findings['main_focus'] + ' ' + findings['full_context']).lower()
-                if any(term in content_check for term in ['framework', 'governance', 'methodology', 'validation', 'enterprise', 'center', 'excellence', 'impact', 'adoption']):
-                    article_num = next((i for i, article in enumerate(
-                        self.knowledge_base, 1) if article['title'] == title), 0)
-                    # Check if this is a Trilogy article
-                    is_trilogy = 'trilogy' in content_check
-                    relevant_findings.append({
-                        'number': article_num,
-                        'title': title,
-                        'author': findings['author'],
-                        'focus': findings['main_focus'],
-                        'context': findings['full_context'][:300],
-                        'methodologies': findings['methodologies'],
-                        'is_trilogy': is_trilogy
-                    })
-
-            # Sort Trilogy articles first
-            relevant_findings.sort(key=lambda x: (
-                not x['is_trilogy'], x['number']))
-
-            if relevant_findings:
-                response = f"Based on our {CONFIG.EXPERT_DOMAIN} research on Centers of Excellence:\n\n"
-                for finding in relevant_findings[:3]:  # Top 3 most relevant
-                    trilogy_label = " (TRILOGY-SPECIFIC)" if finding['is_trilogy'] else ""
-                    response += f"Article #{finding['number']}: '{finding['title']}' by {finding['author']}{trilogy_label}\n"
-                    response += f"Focus: {finding['focus']}\n"
-                    response += f"Key insights: {finding['context']}\n"
-                    if finding['methodologies']:
-                        response += f"Methodologies: {', '.join(finding['methodologies'])}\n"
-                    response += "\n"
-
-                return response + f"We have {len(relevant_findings)} articles covering AI governance and impact measurement. The Trilogy-specific content shows how we differ from other companies through empirical validation and continuous improvement."
-            else:
-                return f"I don't see AI Center of Excellence specifically covered in our {len(self.knowledge_base)} {CONFIG.EXPERT_DOMAIN} research articles. Are you asking about something outside our research focus?"
-
-        # Technology/tools queries - detailed tool analysis with specific examples
-        if any(term in user_lower for term in ['technology', 'tool', 'interesting', 'covered', 'model', 'platform']):
-            interesting_techs = []
-            tools_mentioned = self.knowledge_map.get('tools_mentioned', set())
-
-            for title, findings in self.knowledge_map.get('key_findings', {}).items():
-                if findings['tools_used'] or findings['models_discussed']:
-                    article_num = next((i for i, article in enumerate(
-                        self.knowledge_base, 1) if article['title'] == title), 0)
-                    interesting_techs.append({
-                        'number': article_num,
-                        'title': title,
-                        'author': findings['author'],
-                        'tools': findings['tools_used'],
-                        'models': findings['models_discussed'],
-                        'context': findings['full_context'][:250]
-                    })
-
-            if interesting_techs:
-                response = f"Most interesting technologies covered in our {CONFIG.EXPERT_DOMAIN} research:\n\n"
-                for tech in interesting_techs[:3]:  # Top 3 most interesting
-                    response += f"Article #{tech['number']}: '{tech['title']}' by {tech['author']}\n"
-                    if tech['tools']:
-                        response += f"Tools discussed: {', '.join(tech['tools'])}\n"
-                    if tech['models']:
-                        response += f"Models analyzed: {', '.join(tech['models'])}\n"
-                    response += f"Context: {tech['context']}\n\n"
-
-                return response + f"Overall technologies: {', '.join(sorted(tools_mentioned))}\n\nWhich specific technology or implementation would you like me to explain in detail?"
-
-        # Specific author queries - detailed author expertise
-        author_mapping = {
-            'stanislav': 'Stanislav Huseletov',
-            'leonardo': 'Leonardo Gonzalez',
-            'david': 'David Proctor',
-            'praveen': 'Praveen Koka'
+        # Try category handlers from best to worst keyword match; a handler
+        # returns None when it has nothing to say so the next one gets a turn
+        for category in self._rank_categories(query_tokens, user_lower):
+            response = self._category_handlers[category](query_tokens)
+            if response is not None:
+                return response
+
+        return self._respond_search(user_lower)
+
+    def _build_response_templates(self) -> Dict[str, Any]:
+        """Materialize response fragments that only depend on CONFIG and the article count"""
+        article_count = len(self.knowledge_base)
+        return {
+            'coe_header': f"Based on our {CONFIG.EXPERT_DOMAIN} research on Centers of Excellence:\n\n",
+            'coe_missing': f"I don't see AI Center of Excellence specifically covered in our {article_count} {CONFIG.EXPERT_DOMAIN} research articles. Are you asking about something outside our research focus?",
+            'tech_header': f"Most interesting technologies covered in our {CONFIG.EXPERT_DOMAIN} research:\n\n",
+            'author_headers': {
+                full_name: f"{full_name}'s research expertise in our {CONFIG.EXPERT_DOMAIN} collection:\n\n"
+                for full_name in AUTHOR_MAPPING.values()
+            },
+            'search_header': f"Found relevant content in our {CONFIG.EXPERT_DOMAIN} research:\n\n",
+            'search_missing': f"I don't see this topic covered in our {article_count} {CONFIG.EXPERT_DOMAIN} research articles. Are you asking about something outside our research scope? Please confirm if you'd like general information instead."
         }
 
-        for name_key, full_name in author_mapping.items():
-            if name_key in user_lower or full_name.lower() in user_lower:
+    def _rank_categories(self, query_tokens: set, user_lower: str) -> List[str]:
+        """Order matching response categories by keyword overlap (ties keep priority order)"""
+        scores = {category: sum(1 for token in query_tokens if token.startswith(stems))
+                  for category, stems in CATEGORY_STEMS.items()}
+        # "ai center" only signals a CoE question as a phrase
+        if 'ai center' in user_lower:
+            scores['coe'] += 1
+        scores['author'] = sum(
+            1 for name_key in AUTHOR_MAPPING if name_key in query_tokens)
+
+        ranked = [category for category in CATEGORY_PRIORITY if scores[category] > 0]
+        ranked.sort(key=lambda category: scores[category], reverse=True)
+        return ranked
+
+    def _respond_coe(self, query_tokens: set) -> str:
+        """AI Center of Excellence / CoE queries - TRILOGY-SPECIFIC content first"""
+        # PRIORITY 1: Look for Trilogy-specific CoE content
+        trilogy_coe_article = None
+        for i, article in enumerate(self.knowledge_base, 1):
+            title_tokens = self._title_tokens[i - 1]
+            if 'trilogy' in title_tokens and title_tokens & COE_TITLE_TERMS:
+                trilogy_coe_article = {
+                    'number': i,
+                    'title': article.title,
+                    'author': article.author,
+                    'summary': article.summary,
+                    'content': article.full_content[:COE_EXCERPT_LENGTH]
+                }
+                break
+
+        if trilogy_coe_article:
+            return f"Here's Trilogy's specific Center of Excellence approach from our research:\n\n" + \
+                f"Article #{trilogy_coe_article['number']}: '{trilogy_coe_article['title']}' by {trilogy_coe_article['author']}\n\n" + \
+                f"Summary: {trilogy_coe_article['summary']}\n\n" + \
+                f"Key details from the research:\n{trilogy_coe_article['content']}...\n\n" + \
+                f"This article provides specific insights into how Trilogy's AI Center of Excellence differs from other companies through data-driven approaches and measurable impact metrics."
+
+        # PRIORITY 2: Search for other CoE-related content in our research
+        relevant_findings = []
+        for title, findings in self.knowledge_map.get('key_findings', {}).items():
+            content_check = (
+                title + ' ' + findings['main_focus'] + ' ' + findings['full_context']).lower()
+            if any(term in content_check for term in ['framework', 'governance', 'methodology', 'validation', 'enterprise', 'center', 'excellence', 'impact', 'adoption']):
+                article_num = self._title_to_num.get(title, 0)
+                # Check if this is a Trilogy article
+                is_trilogy = 'trilogy' in content_check
+                relevant_findings.append({
+                    'number': article_num,
+                    'title': title,
+                    'author': findings['author'],
+                    'focus': findings['main_focus'],
+                    'context': findings['full_context'][:300],
+                    'methodologies': findings['methodologies'],
+                    'is_trilogy': is_trilogy
+                })
+
+        # Sort Trilogy articles first
+        relevant_findings.sort(key=lambda x: (
+            not x['is_trilogy'], x['number']))
+
+        if relevant_findings:
+            parts = [self._tpl['coe_header']]
+            for finding in relevant_findings[:3]:  # Top 3 most relevant
+                trilogy_label = " (TRILOGY-SPECIFIC)" if finding['is_trilogy'] else ""
+                parts.append(f"Article #{finding['number']}: '{finding['title']}' by {finding['author']}{trilogy_label}\n")
+                parts.append(f"Focus: {finding['focus']}\n")
+                parts.append(f"Key insights: {finding['context']}\n")
+                if finding['methodologies']:
+                    parts.append(f"Methodologies: {', '.join(finding['methodologies'])}\n")
+                parts.append("\n")
+
+            parts.append(f"We have {len(relevant_findings)} articles covering AI governance and impact measurement. The Trilogy-specific content shows how we differ from other companies through empirical validation and continuous improvement.")
+            return "".join(parts)
+        else:
+            return self._tpl['coe_missing']
+
+    def _respond_tech(self, query_tokens: set) -> Optional[str]:
+        """Technology/tools queries - detailed tool analysis with specific examples"""
+        interesting_techs = []
+        tools_joined = self.knowledge_map.get('tools_sorted_joined', '')
+
+        for title, findings in self.knowledge_map.get('key_findings', {}).items():
+            if findings['tools_used'] or findings['models_discussed']:
+                article_num = self._title_to_num.get(title, 0)
+                interesting_techs.append({
+                    'number': article_num,
+                    'title': title,
+                    'author': findings['author'],
+                    'tools': findings['tools_used'],
+                    'models': findings['models_discussed'],
+                    'context': findings['full_context'][:250]
+                })
+
+        if interesting_techs:
+            parts = [self._tpl['tech_header']]
+            for tech in interesting_techs[:3]:  # Top 3 most interesting
+                parts.append(f"Article #{tech['number']}: '{tech['title']}' by {tech['author']}\n")
+                if tech['tools']:
+                    parts.append(f"Tools discussed: {', '.join(tech['tools'])}\n")
+                if tech['models']:
+                    parts.append(f"Models analyzed: {', '.join(tech['models'])}\n")
+                parts.append(f"Context: {tech['context']}\n\n")
+
+            parts.append(f"Overall technologies: {tools_joined}\n\nWhich specific technology or implementation would you like me to explain in detail?")
+            return "".join(parts)
+
+        return None
+
+    def _respond_author(self, query_tokens: set) -> Optional[str]:
+        """Specific author queries - detailed author expertise"""
+        for name_key, full_name in AUTHOR_MAPPING.items():
+            if name_key in query_tokens:
                 author_works = self.knowledge_map.get(
                     'by_author', {}).get(full_name, [])
                 if author_works:
-                    response = f"{full_name}'s research expertise in our {CONFIG.EXPERT_DOMAIN} collection:\n\n"
+                    parts = [self._tpl['author_headers'][full_name]]
                     for i, work in enumerate(author_works, 1):
-                        article_num = next((j for j, article in enumerate(
-                            self.knowledge_base, 1) if article['title'] == work['title']), 0)
-                        response += f"#{article_num}: '{work['title']}'\n"
-                        response += f"Summary: {work['summary']}\n"
+                        article_num = self._title_to_num.get(work['title'], 0)
+                        parts.append(f"#{article_num}: '{work['title']}'\n")
+                        parts.append(f"Summary: {work['summary']}\n")
                         concepts = work['key_concepts']
                         if concepts['tools']:
-                            response += f"Tools: {', '.join(concepts['tools'])}\n"
+                            parts.append(f"Tools: {', '.join(concepts['tools'])}\n")
                         if concepts['methodologies']:
-                            response += f"Methods: {', '.join(concepts['methodologies'])}\n"
-                        response += "\n"
-
-                    return response + f"{full_name} has {len(author_works)} articles in our research. Which specific work interests you most?"
-
-        # Latest/recent queries with detailed context
-        if any(word in user_lower for word in ['latest', 'recent', 'new']):
-            latest = self.knowledge_map.get('latest_article', {})
-            if latest:
-                findings = self.knowledge_map.get(
-                    'key_findings', {}).get(latest['title'], {})
-                response = f"Our latest research: Article #1 '{latest.get('title')}' by {latest.get('author')}'\n\n"
-                response += f"Published: {latest.get('published', '')[:11]}\n"
-                response += f"Focus: {findings.get('main_focus', latest.get('summary', ''))}\n\n"
-                if findings.get('tools_used'):
-                    response += f"Tools discussed: {', '.join(findings['tools_used'])}\n"
-                if findings.get('models_discussed'):
-                    response += f"Models: {', '.join(findings['models_discussed'])}\n"
-                response += f"\nKey insights: {findings.get('full_context', latest.get('full_content', ''))[:400]}..."
-                return response
-
-        # Broad intelligent search across all content
+                            parts.append(f"Methods: {', '.join(concepts['methodologies'])}\n")
+                        parts.append("\n")
+
+                    parts.append(f"{full_name} has {len(author_works)} articles in our research. Which specific work interests you most?")
+                    return "".join(parts)
+
+        return None
+
+    def _respond_recent(self, query_tokens: set) -> Optional[str]:
+        """Latest/recent queries with detailed context"""
+        latest = self.knowledge_map.get('latest_article')
+        if latest:
+            findings = self.knowledge_map.get(
+                'key_findings', {}).get(latest.title, {})
+            parts = [f"Our latest research: Article #1 '{latest.title}' by {latest.author}'\n\n"]
+            parts.append(f"Published: {latest.published[:11]}\n")
+            parts.append(f"Focus: {findings.get('main_focus', latest.summary)}\n\n")
+            if findings.get('tools_used'):
+                parts.append(f"Tools discussed: {', '.join(findings['tools_used'])}\n")
+            if findings.get('models_discussed'):
+                parts.append(f"Models: {', '.join(findings['models_discussed'])}\n")
+            parts.append(f"\nKey insights: {findings.get('full_context', latest.full_content)[:400]}...")
+            return "".join(parts)
+
+        return None
+
+    def _respond_search(self, user_lower: str) -> str:
+        """Broad intelligent search across all content"""
         search_terms = [word for word in user_lower.split() if len(word) > 3]
         relevant_findings = []
 
+        search_blobs = self.knowledge_map.get('search_blobs', {})
         for title, findings in self.knowledge_map.get('key_findings', {}).items():
-            search_text = (
-                title + ' ' + findings['main_focus'] + ' ' + findings['full_context']).lower()
+            search_text = search_blobs[title]
             relevance_score = sum(
                 1 for term in search_terms if term in search_text)
 
             if relevance_score > 0:
-                article_num = next((i for i, article in enumerate(
-                    self.knowledge_base, 1) if article['title'] == title), 0)
+                article_num = self._title_to_num.get(title, 0)
                 relevant_findings.append({
                     'score': relevance_score,
                     'number': article_num,
@@ -321,22 +536,30 @@ class TrilogyAIChatbot:
         relevant_findings.sort(key=lambda x: x['score'], reverse=True)
 
         if relevant_findings:
-            response = f"Found relevant content in our {CONFIG.EXPERT_DOMAIN} research:\n\n"
+            parts = [self._tpl['search_header']]
             for finding in relevant_findings[:3]:  # Top 3 most relevant
-                response += f"Article #{finding['number']}: '{finding['title']}' by {finding['author']}\n"
-                response += f"Relevance: {finding['focus']}\n"
-                response += f"Details: {finding['context']}...\n\n"
+                parts.append(f"Article #{finding['number']}: '{finding['title']}' by {finding['author']}\n")
+                parts.append(f"Relevance: {finding['focus']}\n")
+                parts.append(f"Details: {finding['context']}...\n\n")
 
-            return response + "Which article would you like me to analyze in detail?"
+            parts.append("Which article would you like me to analyze in detail?")
+            return "".join(parts)
 
         # No matches - ask for clarification
-        return f"I don't see this topic covered in our {len(self.knowledge_base)} {CONFIG.EXPERT_DOMAIN} research articles. Are you asking about something outside our research scope? Please confirm if you'd like general information instead."
+        return self._tpl['search_missing']
 
     # ==============================================================================
     # TRILOGY AI SPECIFIC KNOWLEDGE LOADING (REPLACE WITH YOUR AI SYSTEM)
     # ==============================================================================
 
-    async def _fetch_comprehensive_content(self) -> List[Dict[str, Any]]:
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300))
+        return self._session
+
+    async def _fetch_comprehensive_content(self) -> List[Article]:
         """Comprehensive knowledge fetching using JSON API to get all 41 articles"""
         # Use JSON API instead of RSS to get all articles
         api_url = "https://trilogyai.substack.com/api/v1/posts?offset=0&limit=50"
@@ -344,54 +567,21 @@ class TrilogyAIChatbot:
         logger.info(f"Fetching all articles from JSON API: {api_url}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(api_url) as response:
-                    json_data = await response.json()
-
-                    articles = []
-                    for post in json_data:
-                        title = post.get('title', 'Unknown Title')
-
-                        # Extract author from publishedBylines
-                        author = 'Unknown Author'
-                        if 'publishedBylines' in post and post['publishedBylines']:
-                            author = post['publishedBylines'][0].get(
-                                'name', 'Unknown Author')
-
-                        # Get published date
-                        pub_date = post.get('post_date', '')
-
-                        # Get canonical URL
-                        link = post.get('canonical_url', '')
-
-                        # Get description and body content
-                        description = post.get('description', '')
-                        body_html = post.get('body_html', '')
-
-                        # Use body_html as full content, fallback to description
-                        full_content_raw = body_html if body_html else description
-
-                        # Clean the HTML content
-                        clean_content = self._clean_html_content(
-                            full_content_raw)
-                        clean_summary = self._clean_html_content(description)
-
-                        article = {
-                            'title': title,
-                            'author': author,
-                            'published': pub_date,
-                            'link': link,
-                            'summary': clean_summary,
-                            'full_content': clean_content
-                        }
-
-                        articles.append(article)
-                        logger.info(
-                            f"Processed article {len(articles)}: {article['title'][:50]}...")
+            session = self._get_session()
+            async with session.get(api_url) as response:
+                json_data = json_loads(await response.read())
+
+                # Clean, scan and truncate all articles concurrently off the event loop
+                articles = await asyncio.gather(
+                    *[asyncio.to_thread(self._process_post, post) for post in json_data])
 
+                for i, article in enumerate(articles, 1):
                     logger.info(
-                        f"Successfully fetched {len(articles)} articles from JSON API")
-                    return articles
+                        f"Processed article {i}: {article.title[:50]}...")
+
+                logger.info(
+                    f"Successfully fetched {len(articles)} articles from JSON API")
+                return articles
 
         except Exception as e:
             logger.error(f"Failed to fetch from JSON API: {e}")
@@ -399,86 +589,128 @@ class TrilogyAIChatbot:
             logger.info("Falling back to RSS feed...")
             return await self._fetch_rss_fallback()
 
-    async def _fetch_rss_fallback(self) -> List[Dict[str, Any]]:
+    async def _fetch_rss_fallback(self) -> List[Article]:
         """Fallback RSS feed fetching (limited to ~20 articles)"""
         feed_url = CONFIG.FEED_URL
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(feed_url) as response:
-                    feed_data = await response.text()
-
-                    # Parse the XML feed
-                    root = ET.fromstring(feed_data)
-
-                    articles = []
-                    # Find all item elements
-                    for item in root.findall('.//item'):
-                        title_elem = item.find('title')
-                        title = title_elem.text if title_elem is not None else "Unknown Title"
-
-                        author_elem = item.find('author') or item.find(
-                            './/{http://purl.org/dc/elements/1.1/}creator')
-                        author = author_elem.text if author_elem is not None else "Unknown Author"
-
-                        pub_date_elem = item.find('pubDate')
-                        pub_date = pub_date_elem.text if pub_date_elem is not None else ""
-
-                        link_elem = item.find('link')
-                        link = link_elem.text if link_elem is not None else ""
-
-                        description_elem = item.find('description')
-                        description = description_elem.text if description_elem is not None else ""
-
-                        # Try to find content:encoded for full content
-                        content_elem = item.find(
-                            './/{http://purl.org/rss/1.0/modules/content/}encoded')
-                        if content_elem is not None:
-                            full_content = content_elem.text
-                        else:
-                            full_content = description
-
-                        # Clean the HTML content
-                        clean_content = self._clean_html_content(full_content)
-                        clean_summary = self._clean_html_content(description)
-
-                        article = {
-                            'title': title,
-                            'author': author,
-                            'published': pub_date,
-                            'link': link,
-                            'summary': clean_summary,
-                            'full_content': clean_content
-                        }
-
-                        articles.append(article)
+            session = self._get_session()
+            async with session.get(feed_url) as response:
+                feed_data = await response.read()
 
-                    logger.info(
-                        f"RSS fallback fetched {len(articles)} articles")
-                    return articles
+                # Parse the XML feed
+                root = etree.fromstring(feed_data)
+
+                articles = []
+                # Find all item elements
+                for item in _item_xp(root):
+                    title = _first_text(_title_xp(item), "Unknown Title")
+
+                    author = _first_text(
+                        _author_xp(item) or _creator_xp(item), "Unknown Author")
+
+                    pub_date = _first_text(_pub_date_xp(item), "")
+
+                    link = _first_text(_link_xp(item), "")
+
+                    description = _first_text(_description_xp(item), "")
+
+                    # Clean the HTML content
+                    clean_summary = self._clean_html_content(description)
+
+                    # Try to find content:encoded for full content
+                    encoded = _content_xp(item)
+                    if encoded:
+                        clean_content = self._clean_body_html(encoded[0].text)
+                    else:
+                        clean_content = clean_summary
+
+                    article = self._build_article(
+                        title, author, pub_date, link, clean_summary, clean_content)
+
+                    articles.append(article)
+
+                logger.info(
+                    f"RSS fallback fetched {len(articles)} articles")
+                return articles
 
         except Exception as e:
             logger.error(f"RSS fallback also failed: {e}")
             return []
 
+    def _build_article(self, title: str, author: str, published: str, link: str,
+                       summary: str, full_content: str) -> Article:
+        """Build an article record, extracting concepts before truncating the content"""
+        return Article(
+            title=title,
+            author=author,
+            published=published,
+            link=link,
+            summary=summary,
+            # Only the prefix read by downstream consumers is kept in memory
+            full_content=full_content[:STORED_CONTENT_LENGTH],
+            concepts=self._extract_key_concepts(full_content.lower(), title)
+        )
+
+    def _process_post(self, post: Dict[str, Any]) -> Article:
+        """Turn a JSON API post into an article (runs in a worker thread)"""
+        title = post.get('title', 'Unknown Title')
+
+        # Extract author from publishedBylines
+        author = 'Unknown Author'
+        if 'publishedBylines' in post and post['publishedBylines']:
+            author = post['publishedBylines'][0].get(
+                'name', 'Unknown Author')
+
+        # Get published date
+        pub_date = post.get('post_date', '')
+
+        # Get canonical URL
+        link = post.get('canonical_url', '')
+
+        # Get description and body content
+        description = post.get('description', '')
+        body_html = post.get('body_html', '')
+
+        clean_summary = self._clean_html_content(description)
+
+        # Use body_html as full content, fallback to description
+        if body_html:
+            clean_content = self._clean_body_html(body_html)
+        else:
+            clean_content = clean_summary
+
+        return self._build_article(
+            title, author, pub_date, link, clean_summary, clean_content)
+
     def _clean_html_content(self, html_content: str) -> str:
         """Clean HTML content and extract plain text (from original system)"""
         if not html_content:
             return ""
 
-        # Remove HTML tags
-        clean_text = re.sub(r'<[^>]+>', '', html_content)
-        # Decode HTML entities
-        clean_text = unescape(clean_text)
-        # Clean up whitespace
-        clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+        # Remove HTML tags, decode HTML entities, then clean up whitespace
+        return _sub_ws(' ', unescape(_sub_tag('', html_content))).strip()
 
-        return clean_text
+    def _clean_body_html(self, body_html: str) -> str:
+        """
+        Extract plain text from a full article body. With selectolax installed
+        this is a single C parse instead of the regex cleaner, and its output
+        differs on some inputs: text of <title>/<style>/<script> elements the
+        parser places in <head> (i.e. before any body content) is dropped, and
+        a bare '<' or '>' is read the way browsers do ('x<y' -> 'x', while
+        'a < b and c > d' is kept whole where the regex gives 'a d').
+        """
+        if LexborHTMLParser is None or not body_html:
+            return self._clean_html_content(body_html)
 
-    def _extract_key_concepts(self, content: str, title: str) -> Dict[str, List[str]]:
-        """Extract key concepts based on configured patterns (from original system)"""
-        content_lower = content.lower()
+        # Single C pass: strips tags and decodes HTML entities
+        text = LexborHTMLParser(body_html).text(separator='')
 
+        # Clean up whitespace
+        return _sub_ws(' ', text).strip()
+
+    def _extract_key_concepts(self, content_lower: str, title: str) -> Dict[str, List[str]]:
+        """Extract key concepts from lowercased content based on configured patterns (from original system)"""
         concepts = {
             'tools': [],
             'models': [],
@@ -487,23 +719,26 @@ class TrilogyAIChatbot:
             'frameworks': []
         }
 
+        # Single linear scan collects every configured pattern present in the content
+        found = self._concept_scanner(content_lower)
+
         # Use configured patterns
         for tool in self.tool_patterns:
-            if tool in content_lower:
+            if tool in found:
                 concepts['tools'].append(tool.title())
 
         for model in self.model_patterns:
-            if model in content_lower:
+            if model in found:
                 concepts['models'].append(
                     model.upper() if model == 'llm' else model.title())
 
         for method in self.method_patterns:
-            if method in content_lower:
+            if method in found:
                 concepts['methodologies'].append(method.title())
 
         return concepts
 
-    def _create_detailed_knowledge_map(self, articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _create_detailed_knowledge_map(self, articles: List[Article]) -> Dict[str, Any]:
         """Create comprehensive knowledge map (from original system)"""
         knowledge_map = {
             'chronological_order': [],
@@ -511,8 +746,11 @@ class TrilogyAIChatbot:
             'by_topic': {},
             'key_findings': {},
             'tools_mentioned': set(),
+            'tools_sorted_joined': '',
             'latest_article': None,
-            'earliest_article': None
+            'earliest_article': None,
+            # Lowercased text the broad search matches against, keyed like key_findings
+            'search_blobs': {}
         }
 
         if not articles:
@@ -523,16 +761,20 @@ class TrilogyAIChatbot:
         knowledge_map['earliest_article'] = articles[-1]
 
         for i, article in enumerate(articles):
-            title = article['title']
-            author = article['author']
-            content = article['full_content']
+            title = article.title
+            author = article.author
+            content = article.full_content
+
+            # Concepts were extracted from the full content at fetch time and are
+            # shared between the author and findings views
+            concepts = article.concepts
 
             # Add to chronological order
             knowledge_map['chronological_order'].append({
                 'title': title,
                 'author': author,
                 'rank': i + 1,
-                'published': article.get('published', ''),
+                'published': article.published,
                 'key_points': content[:300] + '...' if len(content) > 300 else content
             })
 
@@ -541,27 +783,35 @@ class TrilogyAIChatbot:
                 knowledge_map['by_author'][author] = []
             knowledge_map['by_author'][author].append({
                 'title': title,
-                'summary': article['summary'][:200],
-                'key_concepts': self._extract_key_concepts(content, title)
+                'summary': article.summary[:200],
+                'key_concepts': concepts
             })
 
-            # Extract and store concepts
-            concepts = self._extract_key_concepts(content, title)
+            # Store concepts
             knowledge_map['tools_mentioned'].update(concepts['tools'])
 
             # Store detailed findings
             knowledge_map['key_findings'][title] = {
                 'author': author,
-                'main_focus': article['summary'][:CONFIG.SUMMARY_MAX_LENGTH],
+                'main_focus': article.summary[:CONFIG.SUMMARY_MAX_LENGTH],
                 'tools_used': concepts['tools'],
                 'models_discussed': concepts['models'],
                 'methodologies': concepts['methodologies'],
                 'full_context': content[:CONFIG.CONTEXT_LENGTH]
             }
 
+            findings = knowledge_map['key_findings'][title]
+            knowledge_map['search_blobs'][title] = (
+                title + ' ' + findings['main_focus'] + ' ' + findings['full_context']).lower()
+
+        # Tools are fixed once the map is built; freeze and pre-join them for replies
+        knowledge_map['tools_mentioned'] = frozenset(knowledge_map['tools_mentioned'])
+        knowledge_map['tools_sorted_joined'] = ', '.join(
+            sorted(knowledge_map['tools_mentioned']))
+
         return knowledge_map
 
-    def _create_optimized_instructions(self, articles: List[Dict[str, Any]], knowledge_map: Dict[str, Any]) -> str:
+    def _create_optimized_instructions(self, articles: List[Article], knowledge_map: Dict[str, Any]) -> str:
         """Create optimized instructions for the agent (from original system)"""
 
         # Handle case where no articles are available
@@ -569,24 +819,26 @@ class TrilogyAIChatbot:
             return CONFIG.FALLBACK_INSTRUCTIONS
 
         # Get latest article details
-        latest = knowledge_map.get('latest_article', {})
+        latest = knowledge_map['latest_article']
 
         # Create compressed article directory
-        article_directory = "COMPLETE ARTICLE DIRECTORY:\n"
+        directory_parts = ["COMPLETE ARTICLE DIRECTORY:\n"]
         for i, article in enumerate(articles, 1):
-            article_directory += f"{i}. {article['title']} ({article['author']}, {article.get('published', '')[:11]})\n"
-            article_directory += f"   Summary: {article['summary'][:CONFIG.SUMMARY_MAX_LENGTH]}...\n"
-            article_directory += f"   Key content: {article['full_content'][:CONFIG.CONTENT_PREVIEW_LENGTH]}...\n\n"
+            directory_parts.append(f"{i}. {article.title} ({article.author}, {article.published[:11]})\n")
+            directory_parts.append(f"   Summary: {article.summary[:CONFIG.SUMMARY_MAX_LENGTH]}...\n")
+            directory_parts.append(f"   Key content: {article.full_content[:CONFIG.CONTENT_PREVIEW_LENGTH]}...\n\n")
+        article_directory = "".join(directory_parts)
 
         # Create author expertise summary
-        author_summary = ""
+        author_parts = []
         for author, works in knowledge_map['by_author'].items():
-            author_summary += f"\n{author}: {len(works)} articles"
+            author_parts.append(f"\n{author}: {len(works)} articles")
             topics = [work['title'][:25] for work in works[:3]]
-            author_summary += f" - {'; '.join(topics)}"
+            author_parts.append(f" - {'; '.join(topics)}")
+        author_summary = "".join(author_parts)
 
         # Create tools summary
-        tools_summary = f"Tools: {', '.join(sorted(knowledge_map['tools_mentioned']))}"
+        tools_summary = f"Tools: {knowledge_map['tools_sorted_joined']}"
 
         # Build instructions using configuration
         instructions = f"""LANGUAGE: ALWAYS RESPOND IN ENGLISH ONLY. NEVER USE SPANISH OR ANY OTHER LANGUAGE.
@@ -595,7 +847,7 @@ You are a {CONFIG.EXPERT_DOMAIN} research expert with EXCLUSIVE ACCESS to our pr
 
         COMMUNICATION: {CONFIG.COMMUNICATION_STYLE}
 
-        LATEST ARTICLE: "{latest.get('title', 'Unknown')}" by {latest.get('author', 'Unknown')}
+        LATEST ARTICLE: "{latest.title}" by {latest.author}
 
         AUTHOR EXPERTISE:{author_summary}
 
@@ -626,7 +878,8 @@ You are a {CONFIG.EXPERT_DOMAIN} research expert with EXCLUSIVE ACCESS to our pr
         - If user just acknowledges your response, DO NOT respond at all - remain silent
         - Only provide responses that reference specific articles, data points, or research findings from our collection"""
 
-        return instructions
+        # Share a single buffer with every consumer of the instructions
+        return sys.intern(instructions)
 
 # ==============================================================================
 # EXAMPLE: SIMPLE OPENAI CHATBOT (COMMENTED OUT)
@@ -18,12 +18,15 @@ Usage:
 import logging
 import os
 import asyncio
+import concurrent.futures
+import functools
 import re
 from typing import Protocol, Optional
 from PIL import Image
 
 from dotenv import load_dotenv
-from livekit.agents import Agent, AgentSession, JobContext, WorkerOptions, WorkerType, cli, ChatContext
+from livekit.agents import Agent, AgentSession, JobContext, JobProcess, WorkerOptions, WorkerType, cli, ChatContext
+from livekit.agents import AgentStateChangedEvent, ChatMessage, ConversationItemAddedEvent
 from livekit.plugins import hedra, openai
 from openai.types.beta.realtime.session import TurnDetection
 
@@ -33,6 +36,88 @@ from ai_chatbot import TrilogyAIChatbot
 logger = logging.getLogger("avatar-service")
 load_dotenv(".env.local")
 
+# Resolved once at import rather than per session
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_WAKE_WORD = os.getenv("WAKE_WORD", "wake up").lower()
+_SLEEP_WORD = os.getenv("SLEEP_WORD", "stop talking").lower()
+
+# Upper bound on the prewarm knowledge-base load, so a hung feed can't keep
+# the worker process from exiting
+_PREWARM_TIMEOUT = 30.0
+
+# Server-side turn detection shared by every realtime session
+_TURN_DETECTION = TurnDetection(
+    type="semantic_vad",
+    eagerness="low",
+    create_response=True,
+    interrupt_response=True,
+)
+
+# ==============================================================================
+# WAKE/SLEEP WORD MATCHING
+# ==============================================================================
+
+
+def _build_match_pattern(word: str, min_partial: int = 3) -> re.Pattern:
+    """
+    Compile a pattern matching the full word or any substring of it of
+    length >= min_partial, treating commas (and other punctuation/whitespace)
+    as word-boundaries. The pattern is lowercase and case-sensitive, so
+    messages must be lowercased before matching.
+    """
+    word = word.lower()
+
+    # 1) Build all contiguous substrings of `word` of length >= min_partial
+    if len(word) >= min_partial:
+        subs = [word[i:i+min_partial]
+                for i in range(len(word) - min_partial + 1)]
+    else:
+        subs = []
+
+    # Drop repeated substrings (and the full word itself) so the alternation
+    # only holds distinct branches
+    subs = [sub for sub in dict.fromkeys(subs) if sub != word]
+
+    # 2) Escape regex-special chars only after slicing, so an escape
+    #    sequence is never split across substrings
+    alternatives = map(re.escape, [word] + subs)
+
+    # 3) Combine into one regex: full word OR any of the substrings
+    #    and require “boundary” = start, end, whitespace or comma/punct
+    punct = r'[\s,.;:!?]'
+    body = r'(?:' + '|'.join(alternatives) + r')'
+    pattern = r'(?:^|' + punct + r')' + body + r'(?:$|' + punct + r')'
+
+    return re.compile(pattern)
+
+
+# ==============================================================================
+# AVATAR IMAGE LOADING
+# ==============================================================================
+
+
+def _avatar_image_path(voice_settings: dict) -> str:
+    """Resolve the avatar image from the chatbot's voice settings"""
+    return os.path.join(
+        _MODULE_DIR,
+        voice_settings.get("avatar_image", "assets/stan.png")
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _load_avatar_rgb(path: str, mtime: float) -> Image.Image:
+    """
+    Decode an avatar image once per (path, mtime) so later sessions skip the
+    PNG decode and alpha conversion. Editing the file changes its mtime and
+    therefore the cache key.
+    """
+    avatar_image = Image.open(path)
+    if avatar_image.mode == 'RGBA':
+        avatar_image = avatar_image.convert('RGB')
+    avatar_image.load()
+    return avatar_image
+
+
 # ==============================================================================
 # AI CHATBOT INTERFACE (Protocol)
 # ==============================================================================
@@ -67,12 +152,22 @@ class AvatarService:
     - Provide user feedback during loading
     """
 
-    def __init__(self, ai_chatbot: AIChatbot):
+    def __init__(self, ai_chatbot: AIChatbot,
+                 chatbot_ready: Optional[concurrent.futures.Future] = None):
         self.ai_chatbot = ai_chatbot
+        # Greeting future from prewarm, if the chatbot was initialized there
+        self._chatbot_ready = chatbot_ready
         self.session: Optional[AgentSession] = None
-        self.wake_word = os.getenv("WAKE_WORD", "wake up")
-        self.sleep_word = os.getenv("SLEEP_WORD", "stop talking")
+        self.wake_word = _WAKE_WORD
+        self.sleep_word = _SLEEP_WORD
+        # Wake/sleep words are fixed per service, so compile their matchers once
+        self._wake_re = _build_match_pattern(self.wake_word)
+        self._sleep_re = _build_match_pattern(self.sleep_word)
         self.speaking_state = 'agentic'  # 'silent', 'agentic'
+        # Most recent user message seen through conversation_item_added
+        self._last_user_item: Optional[ChatMessage] = None
+        # Agent state mirrored from agent_state_changed events
+        self._agent_state = "initializing"
 
     async def start_session(self, ctx: JobContext):
         """Start avatar session with plugged-in AI chatbot"""
@@ -80,40 +175,44 @@ class AvatarService:
         # Get AI chatbot settings
         voice_settings = self.ai_chatbot.get_voice_settings()
 
-        self.session = AgentSession(
-            llm=openai.realtime.RealtimeModel(
-                voice=voice_settings.get("voice", "ash"),
-                speed=voice_settings.get("speed", 1),
-                turn_detection=TurnDetection(
-                    type="semantic_vad",
-                    eagerness="low",
-                    create_response=True,
-                    interrupt_response=True,
-                )
-            ),
-        )
+        # Load the knowledge base while the avatar and session start up.
+        # Hedra must set the audio output before session.start(), so only
+        # the chatbot runs alongside them.
+        if self._chatbot_ready is not None:
+            chatbot_init = asyncio.wrap_future(self._chatbot_ready)
+        else:
+            chatbot_init = asyncio.ensure_future(self.ai_chatbot.initialize())
+
+        self.session = self._create_session(voice_settings)
 
         # Load avatar image
-        avatar_image_path = os.path.join(
-            os.path.dirname(__file__),
-            voice_settings.get("avatar_image", "assets/stan.png")
-        )
-        logger.info(f"Loading avatar image: {avatar_image_path}")
+        avatar_image_path = _avatar_image_path(voice_settings)
+        logger.info("Loading avatar image: %s", avatar_image_path)
 
-        avatar_image = Image.open(avatar_image_path)
-        if avatar_image.mode == 'RGBA':
-            avatar_image = avatar_image.convert('RGB')
+        # Decode on a worker thread so the event loop keeps servicing the room
+        avatar_image = await asyncio.to_thread(
+            _load_avatar_rgb, avatar_image_path, os.path.getmtime(avatar_image_path))
 
         # Start Hedra avatar
         hedra_avatar = hedra.AvatarSession(avatar_image=avatar_image)
         await hedra_avatar.start(self.session, room=ctx.room)
 
-        # Start with basic agent for immediate response
-        initial_ctx = ChatContext()
-        initial_ctx.add_message(
-            role="system",
-            content="Avatar service initializing. Please wait while I load the AI chatbot. RESPOND ONLY IN ENGLISH."
-        )
+        if chatbot_init.done() and chatbot_init.exception() is None:
+            # Chatbot already loaded (e.g. prewarmed): start with the full agent
+            ready_agent = self._build_ready_agent()
+            first_agent = ready_agent
+        else:
+            ready_agent = None
+            # Start with basic agent for immediate response
+            initial_ctx = ChatContext()
+            initial_ctx.add_message(
+                role="system",
+                content="Avatar service initializing. Please wait while I load the AI chatbot. RESPOND ONLY IN ENGLISH."
+            )
+            first_agent = Agent(
+                chat_ctx=initial_ctx,
+                instructions="ENGLISH ONLY: You are an avatar service loading an AI chatbot. Be brief. Always respond in English, never in Spanish or other languages."
+            )
 
         # async def on_user_turn_completed(self, turn_ctx: llm.ChatContext, new_message: llm.ChatMessage):
         #     logger.info(f"User turn completed: {new_message.content}")
@@ -126,86 +225,123 @@ class AvatarService:
 
         # augmented_agent.on_user_turn_completed = on_user_turn_completed
 
-        await self.session.start(
-            agent=Agent(
-                chat_ctx=initial_ctx,
-                instructions="ENGLISH ONLY: You are an avatar service loading an AI chatbot. Be brief. Always respond in English, never in Spanish or other languages."
-            ),
-            room=ctx.room,
-        )
+        await self.session.start(agent=first_agent, room=ctx.room)
 
         try:
-            greeting_message = await self.ai_chatbot.initialize()
+            greeting_message = await chatbot_init
             logger.info("AI chatbot initialized successfully")
 
             # Update agent to use AI responses
-            enhanced_ctx = ChatContext()
-            enhanced_ctx.add_message(
-                role="system",
-                content="Avatar service ready. AI chatbot loaded successfully. ALWAYS RESPOND IN ENGLISH ONLY."
-            )
-
-            # Get the full optimized instructions from the AI chatbot (like original agent_worker.py)
-            full_instructions = self.ai_chatbot.get_full_instructions()
-
-            # Create agent with the comprehensive instructions (same as original system)
-            self.session.update_agent(
-                agent=Agent(
-                    chat_ctx=enhanced_ctx,
-                    instructions=full_instructions
-                )
-            )
-
-            # Start the monitor agent task
-            asyncio.create_task(self.monitor_agent())
+            if ready_agent is None:
+                self.session.update_agent(agent=self._build_ready_agent())
+
+            # React to wake/sleep words whenever the user speaks or the agent
+            # changes state, instead of polling the history. Seed from what
+            # was said while the session and chatbot were starting.
+            self._agent_state = self.session.agent_state
+            self._last_user_item = next(
+                (item for item in reversed(self.session.history.items)
+                 if getattr(item, 'role', None) == 'user'), None)
+            self.session.on("conversation_item_added", self._on_conversation_item_added)
+            self.session.on("agent_state_changed", self._on_agent_state_changed)
+            self.check_last_user_message()
 
             # Announce readiness with AI chatbot's greeting
-            self.session.generate_reply(
-                instructions=f"Say in English: '{greeting_message}'")
+            self._speak(greeting_message)
         except Exception as e:
-            logger.error(f"Failed to initialize AI chatbot: {e}")
-            self.session.generate_reply(
-                instructions="Say in English: 'AI chatbot initialization failed. Please try again later.'"
-            )
+            logger.error("Failed to initialize AI chatbot: %s", e)
+            self._speak("AI chatbot initialization failed. Please try again later.")
 
             # Start the interrupt loop
         # asyncio.create_task(self.interrupt_loop())
 
+    def _build_ready_agent(self) -> Agent:
+        """Build the agent that answers with the loaded AI chatbot's knowledge"""
+        enhanced_ctx = ChatContext()
+        enhanced_ctx.add_message(
+            role="system",
+            content="Avatar service ready. AI chatbot loaded successfully. ALWAYS RESPOND IN ENGLISH ONLY."
+        )
+
+        # Get the full optimized instructions from the AI chatbot (like original agent_worker.py)
+        full_instructions = self.ai_chatbot.get_full_instructions()
+
+        # Create agent with the comprehensive instructions (same as original system)
+        return Agent(
+            chat_ctx=enhanced_ctx,
+            instructions=full_instructions
+        )
+
+    def _create_session(self, voice_settings: dict) -> AgentSession:
+        """
+        Build the AgentSession for this job. Sessions are bound to a single
+        room and are closed by LiveKit on job shutdown, so one is created per job.
+        """
+        return AgentSession(
+            llm=openai.realtime.RealtimeModel(
+                voice=voice_settings.get("voice", "ash"),
+                speed=voice_settings.get("speed", 1),
+                turn_detection=_TURN_DETECTION,
+            ),
+        )
+
+    def _speak(self, text: str) -> None:
+        """
+        Speak a fixed string. With a TTS model the text is synthesized
+        directly; the realtime model has no TTS, so it is asked to read it out.
+        """
+        if self.session.tts is not None:
+            self.session.say(text)
+        else:
+            self.session.generate_reply(instructions=f"Say in English: '{text}'")
+
     def pause_session(self):
         """Pause the avatar session"""
         self.session.interrupt()
 
-    def get_last_user_message(self):
+    def get_last_user_message(self) -> Optional[str]:
         try:
-            messages = self.session.history.items
-            if not messages:
-                return None
-
-            # find the last message with role "user"
-            last_user_message = next(
-                (m for m in reversed(messages) if m.role == 'user'), None)
+            # Tracked as user items are added, so no history scan is needed
+            last_user_message = self._last_user_item
 
             if not last_user_message or not last_user_message.content:
                 return None
-            message_content = last_user_message.content[-1]
 
-            return message_content
+            # Content may mix text with image/audio parts; only text is matched
+            message_content = " ".join(
+                part for part in last_user_message.content if isinstance(part, str))
+
+            return message_content or None
         except Exception as e:
-            logger.error(f"Error in get_last_user_message: {e}")
+            logger.error("Error in get_last_user_message: %s", e)
             return None
 
-    async def monitor_agent(self):
+    def check_last_user_message(self) -> None:
         try:
-            while True:
-                await asyncio.sleep(0.5)
-
-                message_content = self.get_last_user_message()
-                if not message_content:
-                    continue
+            message_content = self.get_last_user_message()
+            if not message_content:
+                return
 
-                self.update_speaking_state_if_necessary(message_content)
+            self.update_speaking_state_if_necessary(message_content)
         except Exception as e:
-            logger.error(f"Error in monitor_agent: {e}")
+            logger.error("Error in check_last_user_message: %s", e)
+
+    def _on_conversation_item_added(self, event: ConversationItemAddedEvent) -> None:
+        item = event.item
+        if getattr(item, 'role', None) != 'user':
+            return
+
+        # History is ordered by creation time, so a late transcript must not
+        # replace a newer message
+        last = self._last_user_item
+        if last is None or item.created_at >= last.created_at:
+            self._last_user_item = item
+        self.check_last_user_message()
+
+    def _on_agent_state_changed(self, event: AgentStateChangedEvent) -> None:
+        self._agent_state = event.new_state
+        # The state gate in update_speaking_state_if_necessary may now pass
+        self.check_last_user_message()
 
     def set_speaking_state(self, state: str):
         self.speaking_state = state
@@ -213,49 +349,31 @@ class AvatarService:
     def is_silent(self) -> bool:
         return self.speaking_state == 'silent'
 
-    def match_word(self, message: str, word: str, min_partial: int = 3) -> bool:
-        """
-        Returns True if `message` contains the full word or any
-        substring of it of length >= min_partial, treating commas (and other
-        punctuation/whitespace) as word-boundaries.
-        """
-        # 1) Escape any regex-special chars in the wake‐word
-        esc = re.escape(word)
-
-        # 2) Build all contiguous substrings of `word` of length >= min_partial
-        if len(word) >= min_partial:
-            subs = [esc[i:i+min_partial]
-                    for i in range(len(esc) - min_partial + 1)]
-        else:
-            subs = []
-
-        # 3) Combine into one regex: full word OR any of the substrings
-        #    and require “boundary” = start, end, whitespace or comma/punct
-        boundary = r'(?:^|[\s,.;:!?])'
-        body = r'(?:' + esc + ('' if not subs else '|' + '|'.join(subs)) + r')'
-        pattern = boundary + body + boundary
-
-        # 4) Search case-insensitively
-        return re.search(pattern, message, re.IGNORECASE) is not None
+    def match_word(self, message: str, pattern: re.Pattern) -> bool:
+        """Returns True if lowercased `message` matches a pattern from _build_match_pattern"""
+        return pattern.search(message) is not None
 
     def update_speaking_state_if_necessary(self, message: str) -> None:
-        state = self.session.agent_state
+        state = self._agent_state
         if state not in ["speaking", "thinking"]:
             return
 
-        # check if the message is a wake word
-        if self.match_word(message, self.wake_word) and self.is_silent():
-            logger.info(f"Setting speaking state to agentic")
-            self.set_speaking_state('agentic')
+        message = message.lower()
+
+        # while silent, only the wake word matters
+        if self.is_silent():
+            if self.match_word(message, self._wake_re):
+                logger.debug("Setting speaking state to agentic")
+                self.set_speaking_state('agentic')
+            else:
+                self.pause_session()
+            return
 
         # check if the message is a sleep word
-        elif self.match_word(message, self.sleep_word):
+        if self.match_word(message, self._sleep_re):
             self.set_speaking_state('silent')
             self.pause_session()
-            logger.info(f"Setting speaking state to silent")
-
-        if self.is_silent():
-            self.pause_session()
+            logger.debug("Setting speaking state to silent")
 
 
 # ==============================================================================
@@ -263,21 +381,52 @@ class AvatarService:
 # ==============================================================================
 
 
-def prewarm(ctx: JobContext):
+async def _initialize_chatbot(ai_chatbot: AIChatbot) -> str:
+    """Load the chatbot's knowledge base, releasing its HTTP session afterwards"""
+    try:
+        return await asyncio.wait_for(ai_chatbot.initialize(), _PREWARM_TIMEOUT)
+    finally:
+        await ai_chatbot.close()
+
+
+def prewarm(proc: JobProcess):
     """Prewarm function for LiveKit worker"""
     logger.info("Avatar service prewarming...")
-    # Any avatar-specific prewarming can go here
+
+    ai_chatbot = TrilogyAIChatbot()
+
+    # Decode the avatar image now so the first session hits the cache
+    avatar_image_path = _avatar_image_path(ai_chatbot.get_voice_settings())
+    _load_avatar_rgb(avatar_image_path, os.path.getmtime(avatar_image_path))
+
+    # Fetch the knowledge base on its own loop while the worker waits for a room
+    executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="chatbot-prewarm")
+    proc.userdata["ai_chatbot"] = ai_chatbot
+    proc.userdata["chatbot_ready"] = executor.submit(
+        asyncio.run, _initialize_chatbot(ai_chatbot))
+    executor.shutdown(wait=False)
+
     logger.info("Avatar service prewarm complete")
 
 
 async def entrypoint(ctx: JobContext):
     """Main entry point - creates avatar service with plugged-in AI chatbot"""
 
-    # Create AI chatbot instance (easily replaceable)
-    ai_chatbot = TrilogyAIChatbot()
+    # Reuse the chatbot prewarmed for this process, if any
+    ai_chatbot = ctx.proc.userdata.pop("ai_chatbot", None)
+    chatbot_ready = ctx.proc.userdata.pop("chatbot_ready", None)
+    if ai_chatbot is None:
+        # Create AI chatbot instance (easily replaceable)
+        ai_chatbot = TrilogyAIChatbot()
+        chatbot_ready = None
+    if chatbot_ready is None:
+        # A prewarmed chatbot's HTTP session belongs to the prewarm thread's
+        # loop, which closes it itself
+        ctx.add_shutdown_callback(ai_chatbot.close)
 
     # Create avatar service with the AI chatbot
-    avatar_service = AvatarService(ai_chatbot)
+    avatar_service = AvatarService(ai_chatbot, chatbot_ready)
 
     # Start the avatar session
     await avatar_service.start_session(ctx)